@@ -9,6 +9,8 @@
  */
 
 import 'dotenv/config';
+import cluster from 'cluster';
+import { gzipSync } from 'zlib';
 import express from 'express';
 import cors from 'cors';
 import { AsyncLocalStorage } from 'async_hooks';
@@ -20,8 +22,14 @@ import { RationSmartClient } from './rationsmart-client.js';
 // ===========================================
 // Structured Logger
 // ===========================================
+// Minimum level from LOG_LEVEL (info|warn|error, default info); checked
+// before the entry object is built so filtered calls skip JSON.stringify
+const LOG_LEVELS: Record<string, number> = { info: 0, warn: 1, error: 2 };
+const LOG_THRESHOLD = LOG_LEVELS[(process.env.LOG_LEVEL || 'info').toLowerCase()] ?? 0;
+
 const logger = {
   _log(level: string, message: string, context?: Record<string, unknown>) {
+    if (LOG_LEVELS[level] < LOG_THRESHOLD) return;
     const entry: Record<string, unknown> = {
       timestamp: new Date().toISOString(),
       level,
@@ -71,13 +79,14 @@ function rateLimiter(req: express.Request, res: express.Response, next: express.
   next();
 }
 
-// Periodic cleanup of expired rate limit entries
+// Periodic cleanup of expired rate limit entries.
+// unref() so this housekeeping timer never keeps the event loop alive on shutdown.
 setInterval(() => {
   const now = Date.now();
   for (const [ip, entry] of rateLimitMap) {
     if (now > entry.resetTime) rateLimitMap.delete(ip);
   }
-}, RATE_LIMIT_WINDOW_MS);
+}, RATE_LIMIT_WINDOW_MS).unref();
 
 // ===========================================
 // Per-request context via AsyncLocalStorage
@@ -85,6 +94,77 @@ setInterval(() => {
 interface RequestContext {}
 const requestContext = new AsyncLocalStorage<RequestContext>();
 
+// ===========================================
+// Response Compression
+// ===========================================
+// Built on node's zlib instead of an external middleware so the dependency
+// set (and lockfile) stays unchanged. Buffers the response and gzips bodies
+// over the threshold when the client accepts it; the 1 KB floor keeps tiny
+// payloads (health checks, errors) uncompressed. SSE responses from the MCP
+// transport are exempt — compressing a stream would hold incremental events
+// in the zlib buffer until the stream closes instead of flushing them as
+// they are written.
+const COMPRESSION_THRESHOLD_BYTES = 1024;
+const COMPRESSIBLE_TYPE_RE = /^(?:application\/json|text\/)/i;
+
+function compressionMiddleware(req: express.Request, res: express.Response, next: express.NextFunction) {
+  const acceptEncoding = String(req.headers['accept-encoding'] ?? '').toLowerCase();
+  if (!acceptEncoding.includes('gzip')) return next();
+
+  const chunks: Buffer[] = [];
+  let passthrough = false;
+  const originalWrite = res.write.bind(res) as (...args: unknown[]) => boolean;
+  const originalEnd = res.end.bind(res) as (...args: unknown[]) => express.Response;
+
+  // Streaming responses must not be buffered: hand writes straight through
+  // as soon as the headers reveal a stream (or have already been sent)
+  const mustPassthrough = () =>
+    res.headersSent || String(res.getHeader('Content-Type') ?? '').includes('text/event-stream');
+
+  const toBuffer = (chunk: unknown, encoding?: unknown): Buffer =>
+    Buffer.isBuffer(chunk)
+      ? chunk
+      : Buffer.from(String(chunk), typeof encoding === 'string' ? (encoding as BufferEncoding) : 'utf8');
+
+  res.write = function (chunk: unknown, encoding?: unknown, callback?: unknown): boolean {
+    if (typeof encoding === 'function') { callback = encoding; encoding = undefined; }
+    if (!passthrough && mustPassthrough()) {
+      passthrough = true;
+      for (const buffered of chunks.splice(0)) originalWrite(buffered);
+    }
+    if (passthrough) return originalWrite(chunk, encoding, callback);
+    if (chunk != null) chunks.push(toBuffer(chunk, encoding));
+    if (typeof callback === 'function') (callback as () => void)();
+    return true;
+  } as typeof res.write;
+
+  res.end = function (chunk?: unknown, encoding?: unknown, callback?: unknown): express.Response {
+    if (typeof chunk === 'function') { callback = chunk; chunk = undefined; }
+    if (typeof encoding === 'function') { callback = encoding; encoding = undefined; }
+    if (!passthrough && mustPassthrough()) {
+      passthrough = true;
+      for (const buffered of chunks.splice(0)) originalWrite(buffered);
+    }
+    if (passthrough) return originalEnd(chunk, encoding, callback);
+
+    if (chunk != null) chunks.push(toBuffer(chunk, encoding));
+    let body = Buffer.concat(chunks);
+    if (
+      body.length >= COMPRESSION_THRESHOLD_BYTES &&
+      !res.getHeader('Content-Encoding') &&
+      COMPRESSIBLE_TYPE_RE.test(String(res.getHeader('Content-Type') ?? ''))
+    ) {
+      body = gzipSync(body);
+      res.setHeader('Content-Encoding', 'gzip');
+      res.setHeader('Content-Length', body.length);
+      res.setHeader('Vary', 'Accept-Encoding');
+    }
+    return originalEnd(body.length > 0 ? body : undefined, callback);
+  } as typeof res.end;
+
+  next();
+}
+
 // ===========================================
 // Express App
 // ===========================================
@@ -92,6 +172,7 @@ const app = express();
 app.set('trust proxy', 1); // Read real client IP from X-Forwarded-For (behind Railway proxy)
 
 app.use(express.json());
+app.use(compressionMiddleware);
 app.use(cors({
   origin: process.env.ALLOWED_ORIGINS?.split(',') || '*',
   exposedHeaders: ['Mcp-Session-Id'],
@@ -112,6 +193,9 @@ const RATIONSMART_API_KEY = process.env.RATIONSMART_API_KEY || '';
 const RATIONSMART_USER_ID = process.env.RATIONSMART_USER_ID || '';
 const RATIONSMART_COUNTRY_ID = process.env.RATIONSMART_COUNTRY_ID || '';
 const PORT = process.env.PORT || 3010;
+// Upstream connection-pool ceilings; undefined falls back to the client defaults
+const RATIONSMART_MAX_SOCKETS = Number(process.env.RATIONSMART_MAX_SOCKETS) || undefined;
+const RATIONSMART_MAX_FREE_SOCKETS = Number(process.env.RATIONSMART_MAX_FREE_SOCKETS) || undefined;
 
 if (!RATIONSMART_API_URL || !RATIONSMART_API_KEY) {
   logger.warn('RATIONSMART_API_URL and RATIONSMART_API_KEY are not set. Server will start but MCP tools will not work.');
@@ -124,44 +208,57 @@ const client = (RATIONSMART_API_URL && RATIONSMART_API_KEY)
       apiKey: RATIONSMART_API_KEY,
       userId: RATIONSMART_USER_ID,
       defaultCountryId: RATIONSMART_COUNTRY_ID,
+      maxSockets: RATIONSMART_MAX_SOCKETS,
+      maxFreeSockets: RATIONSMART_MAX_FREE_SOCKETS,
     })
   : null;
 
 // ===========================================
 // Health Check
 // ===========================================
+// Load balancers poll this many times a minute; everything except the
+// timestamp is invariant, so the JSON is prebuilt and spliced per request
+const HEALTH_JSON_PREFIX = '{"status":"healthy","service":"rationsmart-mcp-server","timestamp":"';
+const HEALTH_JSON_SUFFIX = `","version":"1.0.0","apiConfigured":${!!(RATIONSMART_API_URL && RATIONSMART_API_KEY)}}`;
+
 app.get('/health', (_req, res) => {
-  res.json({
-    status: 'healthy',
-    service: 'rationsmart-mcp-server',
-    timestamp: new Date().toISOString(),
-    version: '1.0.0',
-    apiConfigured: !!(RATIONSMART_API_URL && RATIONSMART_API_KEY),
-  });
+  res.type('application/json').send(HEALTH_JSON_PREFIX + new Date().toISOString() + HEALTH_JSON_SUFFIX);
 });
 
+// ===========================================
+// Tool catalog summaries (static — built and frozen once, shared by the
+// root info endpoint and the startup log)
+// ===========================================
+const TOOL_SUMMARIES: readonly { name: string; description: string }[] = Object.freeze([
+  { name: 'rationsmart.user.ensure', description: 'Ensure user account exists in RationSmart' },
+  { name: 'rationsmart.countries.resolve', description: 'Resolve country from name or coordinates' },
+  { name: 'rationsmart.breeds.list', description: 'List cattle breeds for a country' },
+  { name: 'rationsmart.cows.list', description: 'List user cow profiles' },
+  { name: 'rationsmart.cows.create', description: 'Create a cow profile' },
+  { name: 'rationsmart.diets.generate', description: 'Generate optimized diet for a cow' },
+  { name: 'rationsmart.diets.follow', description: 'Start following a diet' },
+  { name: 'rationsmart.diets.unfollow', description: 'Stop following a diet' },
+  { name: 'rationsmart.diets.schedule.get', description: 'Get daily feeding schedule' },
+  { name: 'rationsmart.diets.history.list', description: 'List diet history for a cow' },
+].map((t) => Object.freeze(t)));
+
+const TOOL_NAMES = Object.freeze(TOOL_SUMMARIES.map((t) => t.name));
+
 // ===========================================
 // Root Info
 // ===========================================
+// The payload is invariant, so serialize it once at startup instead of
+// rebuilding the object and re-stringifying on every request
+const ROOT_INFO_JSON = JSON.stringify({
+  service: 'RationSmart MCP Server',
+  version: '1.0.0',
+  description: 'Dairy cattle nutrition optimization — cow profiles, breed selection, and diet generation',
+  endpoints: { health: '/health', mcp: '/mcp (POST)' },
+  tools: TOOL_SUMMARIES,
+});
+
 app.get('/', (_req, res) => {
-  res.json({
-    service: 'RationSmart MCP Server',
-    version: '1.0.0',
-    description: 'Dairy cattle nutrition optimization — cow profiles, breed selection, and diet generation',
-    endpoints: { health: '/health', mcp: '/mcp (POST)' },
-    tools: [
-      { name: 'rationsmart.user.ensure', description: 'Ensure user account exists in RationSmart' },
-      { name: 'rationsmart.countries.resolve', description: 'Resolve country from name or coordinates' },
-      { name: 'rationsmart.breeds.list', description: 'List cattle breeds for a country' },
-      { name: 'rationsmart.cows.list', description: 'List user cow profiles' },
-      { name: 'rationsmart.cows.create', description: 'Create a cow profile' },
-      { name: 'rationsmart.diets.generate', description: 'Generate optimized diet for a cow' },
-      { name: 'rationsmart.diets.follow', description: 'Start following a diet' },
-      { name: 'rationsmart.diets.unfollow', description: 'Stop following a diet' },
-      { name: 'rationsmart.diets.schedule.get', description: 'Get daily feeding schedule' },
-      { name: 'rationsmart.diets.history.list', description: 'List diet history for a cow' },
-    ],
-  });
+  res.type('application/json').send(ROOT_INFO_JSON);
 });
 
 // ===========================================
@@ -183,6 +280,14 @@ function authenticateMcp(req: express.Request, res: express.Response, next: expr
   next();
 }
 
+// ===========================================
+// Input sanitization patterns (compiled once at module load —
+// regex literals inside handlers are re-created on every call)
+// ===========================================
+const HTML_TAG_RE = /<[^>]*>/g;
+const CONTROL_CHAR_RE = /[\x00-\x1f\x7f]/g;
+const BIDI_INVISIBLE_RE = /[\u200B-\u200F\u202A-\u202E\uFEFF]/g;
+
 // ===========================================
 // Helper: error response
 // ===========================================
@@ -194,6 +299,58 @@ function textResponse(text: string) {
   return { content: [{ type: 'text' as const, text }] };
 }
 
+type ToolResponse = ReturnType<typeof textResponse> | ReturnType<typeof errorResponse>;
+
+// ===========================================
+// Helper: shared tool-handler wrapper
+// ===========================================
+
+// Input fields safe to echo into structured logs
+const LOGGABLE_FIELDS = [
+  'device_id', 'cow_id', 'country_id', 'diet_id',
+  'country_name', 'latitude', 'longitude', 'name', 'breed',
+] as const;
+
+// Static responses shared across calls — no per-call allocation
+const NOT_CONFIGURED_RESPONSE = Object.freeze(errorResponse('Feed service is not configured.'));
+const NOT_CONFIGURED_RETRY_RESPONSE = Object.freeze(errorResponse('Feed service is not configured. Try again in a moment.'));
+
+/** Fixed user-facing error text regardless of the failure. */
+const fixedError = (text: string) => () => text;
+
+/** Prefix plus the underlying error message (or a generic fallback). */
+const detailedError = (prefix: string) => (error: unknown) =>
+  `${prefix} ${error instanceof Error ? error.message : 'Try again in a moment.'}`;
+
+/**
+ * Wrap a tool handler with the boilerplate every tool shares: structured
+ * call logging, the configured-client guard, and last-resort error capture.
+ * Handlers receive a non-null client and only their tool-specific logic.
+ */
+function toolHandler<Input extends Record<string, unknown>>(
+  name: string,
+  onError: (error: unknown) => string,
+  fn: (c: RationSmartClient, input: Input) => Promise<ToolResponse>,
+  notConfiguredResponse: ToolResponse = NOT_CONFIGURED_RESPONSE,
+) {
+  return async (input: Input): Promise<ToolResponse> => {
+    try {
+      const context: Record<string, unknown> = {};
+      for (const field of LOGGABLE_FIELDS) {
+        if (input[field] !== undefined) context[field] = input[field];
+      }
+      logger.info(`${name} called`, context);
+
+      if (!client) return notConfiguredResponse;
+
+      return await fn(client, input);
+    } catch (error: unknown) {
+      logger.error(`Error in ${name}`, { error: error instanceof Error ? error.message : String(error) });
+      return errorResponse(onError(error));
+    }
+  };
+}
+
 // ===========================================
 // Tool Schemas (module level)
 // ===========================================
@@ -279,36 +436,26 @@ COVERAGE: All users.`,
     inputSchema: EnsureUserInputSchema,
     annotations: { readOnlyHint: false, destructiveHint: false, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.user.ensure called', { device_id: input.device_id });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      // Sanitize name: strip HTML, control chars, bidi overrides
-      const sanitizedName = input.name
-        ? input.name
-            .replace(/<[^>]*>/g, '')
-            .replace(/[\x00-\x1f\x7f]/g, '')
-            .replace(/[\u200B-\u200F\u202A-\u202E\uFEFF]/g, '')
-            .trim()
-            .slice(0, 100) || 'Farmer'
-        : undefined;
-
-      const user = await client.ensureUser({
-        deviceId: input.device_id,
-        name: sanitizedName,
-        countryId: input.country_id,
-        language: input.language,
-      });
+  toolHandler('rationsmart.user.ensure', detailedError('Could not ensure user account.'), async (c, input: z.infer<typeof EnsureUserInputSchema>) => {
+    // Sanitize name: strip HTML, control chars, bidi overrides
+    const sanitizedName = input.name
+      ? input.name
+          .replace(HTML_TAG_RE, '')
+          .replace(CONTROL_CHAR_RE, '')
+          .replace(BIDI_INVISIBLE_RE, '')
+          .trim()
+          .slice(0, 100) || 'Farmer'
+      : undefined;
+
+    const user = await c.ensureUser({
+      deviceId: input.device_id,
+      name: sanitizedName,
+      countryId: input.country_id,
+      language: input.language,
+    });
 
-      return textResponse(`User ensured (ID: ${user.id})`);
-    } catch (error: unknown) {
-      // Non-fatal: log and continue — the flow can still work without this
-      logger.error('Error in rationsmart.user.ensure', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse(`Could not ensure user account. ${error instanceof Error ? error.message : 'Try again in a moment.'}`);
-    }
-  },
+    return textResponse(`User ensured (ID: ${user.id})`);
+  }),
 );
 
 // =========================================================
@@ -326,33 +473,30 @@ COVERAGE: Countries with RationSmart feed catalogs.`,
     inputSchema: ResolveCountryInputSchema,
     annotations: { readOnlyHint: true, destructiveHint: false, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.countries.resolve called', { country_name: input.country_name, lat: input.latitude, lon: input.longitude });
-
-      if (!client) return errorResponse('Feed service is not configured. Try again in a moment.');
-
-      const result = await client.resolveCountry({
-        country_name: input.country_name,
-        latitude: input.latitude,
-        longitude: input.longitude,
-      });
+  toolHandler('rationsmart.countries.resolve', detailedError('Could not resolve country.'), async (c, input: z.infer<typeof ResolveCountryInputSchema>) => {
+    const result = await c.resolveCountry({
+      country_name: input.country_name,
+      latitude: input.latitude,
+      longitude: input.longitude,
+    });
 
-      if (!result) return errorResponse('Could not resolve country. Feed catalogs may not be available for your region.');
+    if (!result) return errorResponse('Could not resolve country. Feed catalogs may not be available for your region.');
 
-      // Response format: JSON string — parsed by parseJsonFromText() in rationsmart-flow.ts
-      return textResponse(JSON.stringify(result));
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.countries.resolve', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse(`Could not resolve country. ${error instanceof Error ? error.message : 'Try again in a moment.'}`);
-    }
-  },
+    // Response format: JSON string — parsed by parseJsonFromText() in rationsmart-flow.ts
+    return textResponse(JSON.stringify(result));
+  }, NOT_CONFIGURED_RETRY_RESPONSE),
 );
 
 // =========================================================
 // TOOL 2: rationsmart.breeds.list
 // =========================================================
 
+// Formatted-response cache: breeds.list is read-only and per-country breed
+// catalogs change rarely, so repeated calls skip the backend and re-formatting
+const breedsResponseCache = new Map<string, { response: ToolResponse; cachedAt: number }>();
+const BREEDS_RESPONSE_TTL_MS = 600_000; // 10 minutes
+const BREEDS_RESPONSE_MAX = 64;
+
 mcpServer.registerTool(
   'rationsmart.breeds.list',
   {
@@ -364,24 +508,28 @@ COVERAGE: Per-country breed catalogs.`,
     inputSchema: ListBreedsInputSchema,
     annotations: { readOnlyHint: true, destructiveHint: false, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.breeds.list called', { country_id: input.country_id });
+  toolHandler('rationsmart.breeds.list', fixedError('Could not load breeds. Try again in a moment.'), async (c, input: z.infer<typeof ListBreedsInputSchema>) => {
+    const cached = breedsResponseCache.get(input.country_id);
+    if (cached && Date.now() - cached.cachedAt < BREEDS_RESPONSE_TTL_MS) {
+      return cached.response;
+    }
 
-      if (!client) return errorResponse('Feed service is not configured.');
+    const breeds = await c.listBreeds(input.country_id);
 
-      const breeds = await client.listBreeds(input.country_id);
+    if (breeds.length === 0) return textResponse('No breeds found for this country.');
 
-      if (breeds.length === 0) return textResponse('No breeds found for this country.');
+    // Response format: "- BreedName" per line — parsed by parseBreeds() in rationsmart-flow.ts
+    const lines = breeds.map((b) => `- ${b.name}`);
+    const response = textResponse(lines.join('\n'));
 
-      // Response format: "- BreedName" per line — parsed by parseBreeds() in rationsmart-flow.ts
-      const lines = breeds.map((b) => `- ${b.name}`);
-      return textResponse(lines.join('\n'));
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.breeds.list', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse('Could not load breeds. Try again in a moment.');
+    // Bounded cache: evict the oldest entry at capacity
+    if (breedsResponseCache.size >= BREEDS_RESPONSE_MAX && !breedsResponseCache.has(input.country_id)) {
+      const oldestKey = breedsResponseCache.keys().next().value;
+      if (oldestKey) breedsResponseCache.delete(oldestKey);
     }
-  },
+    breedsResponseCache.set(input.country_id, { response, cachedAt: Date.now() });
+    return response;
+  }),
 );
 
 // =========================================================
@@ -399,24 +547,15 @@ COVERAGE: All users.`,
     inputSchema: ListCowsInputSchema,
     annotations: { readOnlyHint: true, destructiveHint: false, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.cows.list called', { device_id: input.device_id });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      const cows = await client.listCows(input.device_id);
+  toolHandler('rationsmart.cows.list', fixedError('Could not load cow profiles. Try again in a moment.'), async (c, input: z.infer<typeof ListCowsInputSchema>) => {
+    const cows = await c.listCows(input.device_id);
 
-      if (cows.length === 0) return textResponse('');
+    if (cows.length === 0) return textResponse('');
 
-      // Response format: "- CowName (ID: uuid)" per line — parsed by parseCowList() in rationsmart-flow.ts
-      const lines = cows.map((c) => `- ${c.name} (ID: ${c.id})`);
-      return textResponse(lines.join('\n'));
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.cows.list', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse('Could not load cow profiles. Try again in a moment.');
-    }
-  },
+    // Response format: "- CowName (ID: uuid)" per line — parsed by parseCowList() in rationsmart-flow.ts
+    const lines = cows.map((cow) => `- ${cow.name} (ID: ${cow.id})`);
+    return textResponse(lines.join('\n'));
+  }),
 );
 
 // =========================================================
@@ -434,30 +573,21 @@ COVERAGE: All RationSmart-supported countries.`,
     inputSchema: CreateCowInputSchema,
     annotations: { readOnlyHint: false, destructiveHint: false, idempotentHint: false, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.cows.create called', { device_id: input.device_id, name: input.name, breed: input.breed });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      const cow = await client.createCow({
-        device_id: input.device_id,
-        name: input.name,
-        breed: input.breed,
-        body_weight: input.body_weight,
-        milk_production: input.milk_production,
-        lactating: input.lactating,
-        days_of_pregnancy: input.days_of_pregnancy,
-      });
+  toolHandler('rationsmart.cows.create', detailedError('Could not create cow profile.'), async (c, input: z.infer<typeof CreateCowInputSchema>) => {
+    const cow = await c.createCow({
+      device_id: input.device_id,
+      name: input.name,
+      breed: input.breed,
+      body_weight: input.body_weight,
+      milk_production: input.milk_production,
+      lactating: input.lactating,
+      days_of_pregnancy: input.days_of_pregnancy,
+    });
 
-      // Response format: text containing "ID: uuid" — parsed by parseIdFromText() in rationsmart-flow.ts
-      // Note: cow.name comes from user input, so place the ID at the very start to avoid injection
-      return textResponse(`ID: ${cow.id} — Created cow profile '${cow.name}'`);
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.cows.create', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse(`Could not create cow profile. ${error instanceof Error ? error.message : 'Try again in a moment.'}`);
-    }
-  },
+    // Response format: text containing "ID: uuid" — parsed by parseIdFromText() in rationsmart-flow.ts
+    // Note: cow.name comes from user input, so place the ID at the very start to avoid injection
+    return textResponse(`ID: ${cow.id} — Created cow profile '${cow.name}'`);
+  }),
 );
 
 // =========================================================
@@ -475,21 +605,12 @@ COVERAGE: Countries with RationSmart feed catalogs.`,
     inputSchema: GenerateDietInputSchema,
     annotations: { readOnlyHint: false, destructiveHint: false, idempotentHint: false, openWorldHint: true },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.diets.generate called', { device_id: input.device_id, cow_id: input.cow_id, country_id: input.country_id });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      const result = await client.generateDiet(input.cow_id, input.country_id, input.device_id);
+  toolHandler('rationsmart.diets.generate', detailedError('Could not generate diet.'), async (c, input: z.infer<typeof GenerateDietInputSchema>) => {
+    const result = await c.generateDiet(input.cow_id, input.country_id, input.device_id);
 
-      // Response format: summary text containing "Diet saved (ID: uuid)" — parsed by parseDietId() in rationsmart-flow.ts
-      return textResponse(`${result.summary}\n\nDiet saved (ID: ${result.dietId})`);
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.diets.generate', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse(`Could not generate diet. ${error instanceof Error ? error.message : 'Try again in a moment.'}`);
-    }
-  },
+    // Response format: summary text containing "Diet saved (ID: uuid)" — parsed by parseDietId() in rationsmart-flow.ts
+    return textResponse(`${result.summary}\n\nDiet saved (ID: ${result.dietId})`);
+  }),
 );
 
 // =========================================================
@@ -507,19 +628,10 @@ COVERAGE: Users with diet recommendations.`,
     inputSchema: FollowDietInputSchema,
     annotations: { readOnlyHint: false, destructiveHint: false, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.diets.follow called', { device_id: input.device_id, diet_id: input.diet_id });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      const message = await client.followDiet(input.device_id, input.diet_id);
-      return textResponse(message);
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.diets.follow', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse('Could not start diet follow-up. Try again in a moment.');
-    }
-  },
+  toolHandler('rationsmart.diets.follow', fixedError('Could not start diet follow-up. Try again in a moment.'), async (c, input: z.infer<typeof FollowDietInputSchema>) => {
+    const message = await c.followDiet(input.device_id, input.diet_id);
+    return textResponse(message);
+  }),
 );
 
 // =========================================================
@@ -537,19 +649,10 @@ COVERAGE: Users with active diet follow-ups.`,
     inputSchema: UnfollowDietInputSchema,
     annotations: { readOnlyHint: false, destructiveHint: true, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.diets.unfollow called', { device_id: input.device_id, diet_id: input.diet_id });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      const message = await client.unfollowDiet(input.device_id, input.diet_id);
-      return textResponse(message);
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.diets.unfollow', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse('Could not stop diet follow-up. Try again in a moment.');
-    }
-  },
+  toolHandler('rationsmart.diets.unfollow', fixedError('Could not stop diet follow-up. Try again in a moment.'), async (c, input: z.infer<typeof UnfollowDietInputSchema>) => {
+    const message = await c.unfollowDiet(input.device_id, input.diet_id);
+    return textResponse(message);
+  }),
 );
 
 // =========================================================
@@ -567,19 +670,10 @@ COVERAGE: Cows with active diet recommendations.`,
     inputSchema: GetScheduleInputSchema,
     annotations: { readOnlyHint: true, destructiveHint: false, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.diets.schedule.get called', { device_id: input.device_id, cow_id: input.cow_id });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      const schedule = await client.getDietSchedule(input.device_id, input.cow_id);
-      return textResponse(schedule);
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.diets.schedule.get', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse('Could not load feeding schedule. Try again in a moment.');
-    }
-  },
+  toolHandler('rationsmart.diets.schedule.get', fixedError('Could not load feeding schedule. Try again in a moment.'), async (c, input: z.infer<typeof GetScheduleInputSchema>) => {
+    const schedule = await c.getDietSchedule(input.device_id, input.cow_id);
+    return textResponse(schedule);
+  }),
 );
 
 // =========================================================
@@ -597,28 +691,23 @@ COVERAGE: Users with cow profiles.`,
     inputSchema: ListHistoryInputSchema,
     annotations: { readOnlyHint: true, destructiveHint: false, idempotentHint: true, openWorldHint: false },
   },
-  async (input) => {
-    try {
-      logger.info('rationsmart.diets.history.list called', { device_id: input.device_id, cow_id: input.cow_id });
-
-      if (!client) return errorResponse('Feed service is not configured.');
-
-      const history = await client.listDietHistory(input.device_id, input.cow_id);
-      return textResponse(history);
-    } catch (error: unknown) {
-      logger.error('Error in rationsmart.diets.history.list', { error: error instanceof Error ? error.message : String(error) });
-      return errorResponse('Could not load diet history. Try again in a moment.');
-    }
-  },
+  toolHandler('rationsmart.diets.history.list', fixedError('Could not load diet history. Try again in a moment.'), async (c, input: z.infer<typeof ListHistoryInputSchema>) => {
+    const history = await c.listDietHistory(input.device_id, input.cow_id);
+    return textResponse(history);
+  }),
 );
 
 // ===========================================
 // MCP Endpoint
 // ===========================================
+// Accept value the SDK transport requires; hoisted so the fix-up below is a
+// reference assignment rather than a fresh string per request
+const MCP_ACCEPT = 'application/json, text/event-stream';
+
 app.post('/mcp', authenticateMcp, async (req, res) => {
-  const accept = req.headers.accept || '';
-  if (!accept.includes('application/json') || !accept.includes('text/event-stream')) {
-    req.headers.accept = 'application/json, text/event-stream';
+  const accept = req.headers.accept;
+  if (accept !== MCP_ACCEPT && (!accept || !accept.includes('application/json') || !accept.includes('text/event-stream'))) {
+    req.headers.accept = MCP_ACCEPT;
   }
 
   try {
@@ -649,45 +738,117 @@ app.post('/mcp', authenticateMcp, async (req, res) => {
 // Start Server
 // ===========================================
 const HOST = '0.0.0.0';
-const httpServer = app.listen(Number(PORT), HOST, () => {
-  logger.info('Server started', {
-    host: HOST,
-    port: PORT,
-    version: '1.0.0',
-    apiConfigured: !!(RATIONSMART_API_URL && RATIONSMART_API_KEY),
-    tools: [
-      'rationsmart.user.ensure',
-      'rationsmart.countries.resolve',
-      'rationsmart.breeds.list',
-      'rationsmart.cows.list',
-      'rationsmart.cows.create',
-      'rationsmart.diets.generate',
-      'rationsmart.diets.follow',
-      'rationsmart.diets.unfollow',
-      'rationsmart.diets.schedule.get',
-      'rationsmart.diets.history.list',
-    ],
-  });
-});
+// Worker processes to run (cluster module shares the listening socket).
+// Default 1 preserves single-process behavior; size per-worker pool limits
+// (RATIONSMART_MAX_SOCKETS) accordingly when raising this on multi-core hosts.
+const WEB_CONCURRENCY = Number(process.env.WEB_CONCURRENCY) || 1;
+
+function startServer() {
+  const httpServer = app.listen(Number(PORT), HOST, () => {
+    logger.info('Server started', {
+      host: HOST,
+      port: PORT,
+      version: '1.0.0',
+      apiConfigured: !!(RATIONSMART_API_URL && RATIONSMART_API_KEY),
+      tools: TOOL_NAMES,
+    });
 
-// ===========================================
-// Graceful Shutdown
-// ===========================================
-function gracefulShutdown(signal: string) {
-  logger.info('Shutdown signal received', { signal });
-  const forceTimeout = setTimeout(() => {
-    logger.error('Forced shutdown after 10s timeout', { signal });
-    process.exit(1);
-  }, 10_000);
-  forceTimeout.unref();
-  httpServer.close(() => {
-    logger.info('HTTP server closed gracefully');
-    process.exit(0);
+    // Warm the upstream path in the background: resolves DNS, opens a keep-alive
+    // socket through the TLS handshake, and primes the country cache so the
+    // first tool call doesn't pay cold-start latency. Failure is non-fatal —
+    // the first real request will simply warm things itself.
+    client?.getCountries().catch((error: unknown) => {
+      logger.warn('Startup pre-warm failed', {
+        error: error instanceof Error ? error.message : String(error),
+      });
+    });
   });
+
+  // ===========================================
+  // Graceful Shutdown
+  // ===========================================
+  function gracefulShutdown(signal: string) {
+    logger.info('Shutdown signal received', { signal });
+    const forceTimeout = setTimeout(() => {
+      logger.error('Forced shutdown after 10s timeout', { signal });
+      client?.close();
+      process.exit(1);
+    }, 10_000);
+    forceTimeout.unref();
+    httpServer.close(() => {
+      logger.info('HTTP server closed gracefully');
+      client?.close(); // drop keep-alive sockets to the backend
+      process.exit(0);
+    });
+  }
+
+  process.on('SIGTERM', () => gracefulShutdown('SIGTERM'));
+  process.on('SIGINT', () => gracefulShutdown('SIGINT'));
 }
 
-process.on('SIGTERM', () => gracefulShutdown('SIGTERM'));
-process.on('SIGINT', () => gracefulShutdown('SIGINT'));
+// Refork throttle: a worker crash-looping at boot (bad env, port conflict)
+// must not refork in a tight loop
+const REFORK_WINDOW_MS = 60_000;
+const REFORK_MAX_PER_WINDOW = 5;
+
+if (cluster.isPrimary && WEB_CONCURRENCY > 1) {
+  logger.info('Starting worker processes', { workers: WEB_CONCURRENCY });
+  for (let i = 0; i < WEB_CONCURRENCY; i++) {
+    cluster.fork();
+  }
+
+  let shuttingDown = false;
+  let reforkWindowStart = Date.now();
+  let reforkCount = 0;
+
+  cluster.on('exit', (worker, code) => {
+    if (shuttingDown) {
+      // Primary exits once the last worker has finished its graceful shutdown
+      if (Object.keys(cluster.workers ?? {}).length === 0) {
+        logger.info('All workers exited, stopping primary');
+        process.exit(0);
+      }
+      return;
+    }
+    // Restart crashed workers; clean exits (graceful shutdown) are final
+    if (code !== 0 && !worker.exitedAfterDisconnect) {
+      const now = Date.now();
+      if (now - reforkWindowStart > REFORK_WINDOW_MS) {
+        reforkWindowStart = now;
+        reforkCount = 0;
+      }
+      if (reforkCount >= REFORK_MAX_PER_WINDOW) {
+        logger.error('Worker crash loop detected, not reforking', { pid: worker.process.pid, code });
+        return;
+      }
+      reforkCount++;
+      logger.warn('Worker died, restarting', { pid: worker.process.pid, code });
+      cluster.fork();
+    }
+  });
+
+  // Deploy platforms signal the primary only — forward shutdown signals to
+  // every worker so each runs its own gracefulShutdown, then exit via the
+  // 'exit' handler above once they are all gone
+  function shutdownPrimary(signal: NodeJS.Signals) {
+    if (shuttingDown) return;
+    shuttingDown = true;
+    logger.info('Shutdown signal received, stopping workers', { signal });
+    for (const worker of Object.values(cluster.workers ?? {})) {
+      worker?.process.kill(signal);
+    }
+    // Mirror the worker-level 10s deadline in case a worker hangs
+    setTimeout(() => {
+      logger.error('Forced primary shutdown after 10s timeout', { signal });
+      process.exit(1);
+    }, 10_000).unref();
+  }
+
+  process.on('SIGTERM', () => shutdownPrimary('SIGTERM'));
+  process.on('SIGINT', () => shutdownPrimary('SIGINT'));
+} else {
+  startServer();
+}
 
 process.on('unhandledRejection', (reason) => {
   logger.error('Unhandled rejection', { reason: String(reason) });
@@ -7,7 +7,10 @@
  */
 
 import fetch from 'node-fetch';
-import { randomUUID } from 'crypto';
+import { randomBytes } from 'crypto';
+import { Agent as HttpAgent } from 'http';
+import { Agent as HttpsAgent } from 'https';
+import type { URL } from 'url';
 
 // ===========================================
 // Types
@@ -122,6 +125,63 @@ export interface RationSmartClientConfig {
   userId: string;
   /** Default country_id fallback. */
   defaultCountryId: string;
+  /** Max concurrent sockets per host (default 64). */
+  maxSockets?: number;
+  /** Max idle keep-alive sockets retained per host (default 16). */
+  maxFreeSockets?: number;
+  /** Deadline for ordinary CRUD/reference-data requests (default 30s). */
+  requestTimeoutMs?: number;
+  /** Deadline for the diet optimizer, which can legitimately run long (default 60s). */
+  optimizerTimeoutMs?: number;
+}
+
+// Feed names matching any of these are treated as forages for scheduling
+const FORAGE_KEYWORDS = ['forage', 'grass', 'hay', 'straw', 'silage'];
+
+// Simple bounding-box lookup for RationSmart active countries (frozen — it is
+// probed on every geo-resolve and must never be rebuilt or mutated per call)
+const COUNTRY_BOUNDING_BOXES: Readonly<Record<string, { minLat: number; maxLat: number; minLon: number; maxLon: number }>> = Object.freeze({
+  BGD: { minLat: 20.5, maxLat: 26.6, minLon: 88.0, maxLon: 92.7 },   // Bangladesh
+  ETH: { minLat: 3.0,  maxLat: 15.0, minLon: 33.0, maxLon: 48.0 },   // Ethiopia
+  IND: { minLat: 6.5,  maxLat: 35.5, minLon: 68.0, maxLon: 97.5 },   // India
+  IDN: { minLat: -11.0, maxLat: 6.1, minLon: 95.0, maxLon: 141.0 },  // Indonesia
+  MAR: { minLat: 27.6, maxLat: 35.9, minLon: -13.2, maxLon: -1.0 },  // Morocco
+  NPL: { minLat: 26.3, maxLat: 30.5, minLon: 80.0, maxLon: 88.2 },   // Nepal
+  PAK: { minLat: 23.6, maxLat: 37.1, minLon: 60.8, maxLon: 77.8 },   // Pakistan
+  PHL: { minLat: 4.6,  maxLat: 21.1, minLon: 116.9, maxLon: 126.6 }, // Philippines
+  THA: { minLat: 5.6,  maxLat: 20.5, minLon: 97.3, maxLon: 105.6 },  // Thailand
+  VNM: { minLat: 8.2,  maxLat: 23.4, minLon: 102.1, maxLon: 109.5 }, // Vietnam
+});
+
+const WHITESPACE_RE = /\s+/g;
+
+// Shared date formatter: toLocaleDateString() re-resolves the locale and
+// builds a fresh formatter on every call, which shows up when formatting
+// one date per history row
+const DATE_FORMATTER = new Intl.DateTimeFormat();
+
+/** Normalize a country name/code for matching: lowercase, trimmed, single-spaced. */
+function normalizeCountryKey(value: string): string {
+  return value.trim().toLowerCase().replace(WHITESPACE_RE, ' ');
+}
+
+// Fixed environment/management assumptions for the optimizer — every diet
+// request shares these; only the cow-derived fields vary per call
+const CATTLE_INFO_DEFAULTS = Object.freeze({
+  temperature: 25,
+  topography: 'Flat',
+  distance: 0,
+  calving_interval: 365,
+  bw_gain: 0,
+  bc_score: 3.0,
+});
+
+/** Error carrying the upstream HTTP status so callers can branch on it. */
+export class RationSmartApiError extends Error {
+  constructor(message: string, readonly status: number) {
+    super(message);
+    this.name = 'RationSmartApiError';
+  }
 }
 
 // ===========================================
@@ -129,38 +189,223 @@ export interface RationSmartClientConfig {
 // ===========================================
 
 export class RationSmartClient {
-  private baseUrl: string;
-  private apiKey: string;
-  private userId: string;
-  private defaultCountryId: string;
+  private readonly baseUrl: string;
+  private readonly apiKey: string;
+  private readonly userId: string;
+  private readonly defaultCountryId: string;
+
+  // Request headers never change after construction — build them once
+  private readonly headers: Record<string, string>;
+
+  // Per-class-of-call deadlines: fail ordinary calls fast, give the optimizer room
+  private readonly requestTimeoutMs: number;
+  private readonly optimizerTimeoutMs: number;
+
+  // Keep-alive agents so sequential/concurrent requests reuse TCP+TLS connections
+  // instead of paying a fresh handshake per call (node-fetch defaults to no keep-alive)
+  private readonly httpAgent: HttpAgent;
+  private readonly httpsAgent: HttpsAgent;
+
+  // Circuit breaker: after several consecutive backend failures, fail fast
+  // for a cooldown window instead of stacking up doomed requests
+  private consecutiveFailures = 0;
+  private breakerOpenUntil = 0;
+  private static BREAKER_THRESHOLD = 5;
+  private static BREAKER_COOLDOWN_MS = 30_000;
+  private static MAX_GET_RETRIES = 2;
+  private static RETRY_BASE_DELAY_MS = 250;
 
   // In-memory country cache (refreshed every hour)
   private cachedCountries: Country[] | null = null;
   private cachedCountriesAt = 0;
+  private cachedCountriesEtag: string | undefined;
   private static COUNTRY_CACHE_TTL = 3_600_000; // 1 hour
 
+  // Lookup index over the cached countries: lowercased name and ISO code →
+  // country, rebuilt on cache refresh so resolution is O(1) instead of a scan
+  private countryIndex = new Map<string, Country>();
+
+  // Memoized name-query resolutions (a farmer's country rarely changes, so
+  // hit rate is near 100%); cleared whenever the country cache refreshes
+  private resolvedCountryCache = new Map<string, { country_id: string; country_name: string; currency: string }>();
+  private static RESOLVED_CACHE_MAX = 256;
+
+  // In-memory feed catalog cache per country (feeds are quasi-static reference data)
+  private cachedFeeds = new Map<string, { feeds: FeedDetails[]; cachedAt: number; etag?: string }>();
+  private static FEEDS_CACHE_TTL = 300_000; // 5 minutes
+
+  // Breed catalog cache per country — breeds change about as often as countries do
+  private cachedBreeds = new Map<string, { breeds: Breed[]; cachedAt: number }>();
+  private static BREEDS_CACHE_TTL = 3_600_000; // 1 hour
+
+  // Short-TTL cow profile cache: diet generation and schedule lookups re-read
+  // the same cow several times within a session
+  private cachedCows = new Map<string, { cow: CowProfile; cachedAt: number }>();
+  private static COW_CACHE_TTL = 30_000; // 30 seconds
+  private static COW_CACHE_MAX = 128;
+
+  // Single-flight map: concurrent identical reads share one upstream request
+  private inflight = new Map<string, Promise<unknown>>();
+
+  // Path prefixes for endpoints hit from multiple methods
+  private static readonly COW_DETAIL_PATH = '/cow-profiles/detail/';
+  private static readonly DIET_HISTORY_PATH = '/bot-diet-history/';
+
   constructor(config: RationSmartClientConfig) {
     this.baseUrl = config.baseUrl.replace(/\/$/, '');
     this.apiKey = config.apiKey;
     this.userId = config.userId;
     this.defaultCountryId = config.defaultCountryId;
+    // Pool ceilings: defaults handle bursty MCP fan-out without connection churn,
+    // tunable per deployment via config
+    const agentOptions = {
+      keepAlive: true,
+      maxSockets: config.maxSockets ?? 64,
+      maxFreeSockets: config.maxFreeSockets ?? 16,
+    };
+    this.httpAgent = new HttpAgent(agentOptions);
+    this.httpsAgent = new HttpsAgent(agentOptions);
+    this.requestTimeoutMs = config.requestTimeoutMs ?? 30_000;
+    this.optimizerTimeoutMs = config.optimizerTimeoutMs ?? 60_000;
+    this.headers = RationSmartClient.buildHeaders(this.apiKey);
   }
 
-  // ---- HTTP helpers ----
-
-  private getHeaders(): Record<string, string> {
-    return {
+  /**
+   * Pure header builder: headers depend only on the API key. Kept separate so
+   * a future token-refresh flow can rebuild them without touching the client.
+   */
+  private static buildHeaders(apiKey: string): Record<string, string> {
+    return Object.freeze({
       'Content-Type': 'application/json',
-      'Authorization': `Bearer ${this.apiKey}`,
+      'Authorization': `Bearer ${apiKey}`,
       'User-Agent': 'RationSmart-MCP-Server/1.0.0',
-    };
+      // Explicitly advertise the codecs node-fetch can decode — diet results
+      // are highly compressible JSON, and proxies sometimes strip the default
+      'Accept-Encoding': 'br, gzip, deflate',
+    });
+  }
+
+  /** Route requests through the matching keep-alive agent. */
+  private selectAgent = (url: URL): HttpAgent | HttpsAgent =>
+    url.protocol === 'http:' ? this.httpAgent : this.httpsAgent;
+
+  /**
+   * Coalesce concurrent identical calls: while a request for `key` is in
+   * flight, later callers await the same promise instead of re-hitting the
+   * backend. The entry is dropped as soon as the request settles.
+   */
+  private singleFlight<T>(key: string, fn: () => Promise<T>): Promise<T> {
+    const existing = this.inflight.get(key);
+    if (existing) return existing as Promise<T>;
+    const pending = fn().finally(() => this.inflight.delete(key));
+    this.inflight.set(key, pending);
+    return pending;
+  }
+
+  /**
+   * Conditional GET for reference-data endpoints. Sends If-None-Match when a
+   * prior ETag is known; a 304 returns `data: null`, meaning the caller's
+   * cached copy is still current. Kept outside the retry/breaker wrapper —
+   * these endpoints have TTL-cache fallbacks and refresh at most once per TTL.
+   */
+  private async conditionalGet<T>(path: string, etag?: string): Promise<{ data: T | null; etag?: string }> {
+    const url = `${this.baseUrl}${path}`;
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), this.requestTimeoutMs);
+
+    try {
+      const response = await fetch(url, {
+        method: 'GET',
+        headers: etag ? { ...this.headers, 'If-None-Match': etag } : this.headers,
+        signal: controller.signal,
+        agent: this.selectAgent,
+      });
+
+      clearTimeout(timeoutId);
+
+      if (response.status === 304) {
+        return { data: null, etag };
+      }
+      if (!response.ok) {
+        throw new RationSmartApiError(`RationSmart API error (${response.status})`, response.status);
+      }
+      const text = await response.text();
+      return {
+        data: (text ? JSON.parse(text) : null) as T,
+        etag: response.headers.get('etag') ?? undefined,
+      };
+    } catch (error: unknown) {
+      clearTimeout(timeoutId);
+      if (error instanceof Error && error.name === 'AbortError') {
+        throw new Error('Request timed out');
+      }
+      throw error;
+    }
+  }
+
+  /** Tear down keep-alive sockets. Call once on server shutdown. */
+  close(): void {
+    this.httpAgent.destroy();
+    this.httpsAgent.destroy();
   }
 
+  // ---- HTTP helpers ----
+
   private async request<T>(
     method: string,
     path: string,
     body?: Record<string, unknown>,
-    timeoutMs = 30_000,
+    timeoutMs?: number,
+  ): Promise<T> {
+    const deadline = timeoutMs ?? this.requestTimeoutMs;
+    if (Date.now() < this.breakerOpenUntil) {
+      throw new Error('RationSmart backend temporarily unavailable. Try again shortly.');
+    }
+
+    // Only GETs are retried — write endpoints are not idempotent
+    const retries = method === 'GET' ? RationSmartClient.MAX_GET_RETRIES : 0;
+    let lastError: unknown;
+
+    for (let attempt = 0; attempt <= retries; attempt++) {
+      if (attempt > 0) {
+        const delay = RationSmartClient.RETRY_BASE_DELAY_MS * 2 ** (attempt - 1);
+        await new Promise((resolve) => setTimeout(resolve, delay));
+      }
+      try {
+        const result = await this.attemptRequest<T>(method, path, body, deadline);
+        this.consecutiveFailures = 0;
+        return result;
+      } catch (error: unknown) {
+        lastError = error;
+        // Client errors (4xx) are deterministic: no retry, no breaker penalty
+        if (error instanceof RationSmartApiError && error.status < 500) {
+          throw error;
+        }
+        this.recordFailure();
+      }
+    }
+    throw lastError;
+  }
+
+  private recordFailure(): void {
+    this.consecutiveFailures++;
+    if (this.consecutiveFailures >= RationSmartClient.BREAKER_THRESHOLD) {
+      this.breakerOpenUntil = Date.now() + RationSmartClient.BREAKER_COOLDOWN_MS;
+      this.consecutiveFailures = 0;
+      process.stderr.write(JSON.stringify({
+        timestamp: new Date().toISOString(),
+        level: 'warn',
+        service: 'rationsmart-client',
+        message: `Circuit breaker opened for ${RationSmartClient.BREAKER_COOLDOWN_MS / 1000}s after repeated backend failures`,
+      }) + '\n');
+    }
+  }
+
+  private async attemptRequest<T>(
+    method: string,
+    path: string,
+    body: Record<string, unknown> | undefined,
+    timeoutMs: number,
   ): Promise<T> {
     const url = `${this.baseUrl}${path}`;
     const controller = new AbortController();
@@ -169,9 +414,10 @@ export class RationSmartClient {
     try {
       const response = await fetch(url, {
         method,
-        headers: this.getHeaders(),
+        headers: this.headers,
         body: body ? JSON.stringify(body) : undefined,
         signal: controller.signal,
+        agent: this.selectAgent,
       });
 
       clearTimeout(timeoutId);
@@ -187,10 +433,13 @@ export class RationSmartClient {
           path,
           detail: errorText.slice(0, 500),
         }) + '\n');
-        throw new Error(`RationSmart API error (${response.status})`);
+        throw new RationSmartApiError(`RationSmart API error (${response.status})`, response.status);
       }
 
-      return (await response.json()) as T;
+      // Parse via text: identical cost to response.json() (which buffers then
+      // parses anyway) but tolerates empty 200/204 bodies on write endpoints
+      const text = await response.text();
+      return (text ? JSON.parse(text) : undefined) as T;
     } catch (error: unknown) {
       clearTimeout(timeoutId);
       if (error instanceof Error && error.name === 'AbortError') {
@@ -207,10 +456,30 @@ export class RationSmartClient {
     if (this.cachedCountries && now - this.cachedCountriesAt < RationSmartClient.COUNTRY_CACHE_TTL) {
       return this.cachedCountries;
     }
-    const countries = await this.request<Country[]>('GET', '/auth/countries');
-    this.cachedCountries = countries.filter((c) => c.is_active);
-    this.cachedCountriesAt = now;
-    return this.cachedCountries;
+    // Coalesce concurrent cold/expired fetches — a burst of tool calls on a
+    // fresh process would otherwise all hit /auth/countries at once
+    return this.singleFlight('countries', async () => {
+      const { data, etag } = await this.conditionalGet<Country[]>('/auth/countries', this.cachedCountriesEtag);
+      if (data === null && this.cachedCountries) {
+        // 304 — backend confirms our copy is still current
+        this.cachedCountriesAt = now;
+        return this.cachedCountries;
+      }
+      this.cachedCountries = (data || []).filter((c) => c.is_active);
+      this.cachedCountriesAt = now;
+      this.cachedCountriesEtag = etag;
+      this.rebuildCountryIndex(this.cachedCountries);
+      return this.cachedCountries;
+    });
+  }
+
+  private rebuildCountryIndex(countries: Country[]): void {
+    this.resolvedCountryCache.clear();
+    this.countryIndex.clear();
+    for (const c of countries) {
+      this.countryIndex.set(normalizeCountryKey(c.name), c);
+      this.countryIndex.set(normalizeCountryKey(c.country_code), c);
+    }
   }
 
   async resolveCountry(params: {
@@ -221,14 +490,30 @@ export class RationSmartClient {
     const countries = await this.getCountries();
     if (countries.length === 0) return null;
 
-    // Match by name (case-insensitive partial match)
+    // Match by name or ISO code via the precomputed index (case-insensitive)
     if (params.country_name) {
-      const query = params.country_name.toLowerCase();
-      const match = countries.find(
-        (c) => c.name.toLowerCase() === query || c.country_code.toLowerCase() === query,
-      );
+      const key = normalizeCountryKey(params.country_name);
+      const memoized = this.resolvedCountryCache.get(key);
+      if (memoized) return memoized;
+
+      let match = this.countryIndex.get(key);
+      if (!match) {
+        // Partial match fallback for sloppy input ("bangla", "the philippines"):
+        // single pass over the catalog, substring either direction
+        for (const c of countries) {
+          const name = normalizeCountryKey(c.name);
+          if (name.includes(key) || key.includes(name)) {
+            match = c;
+            break;
+          }
+        }
+      }
       if (match) {
-        return { country_id: match.id, country_name: match.name, currency: match.currency };
+        const resolved = { country_id: match.id, country_name: match.name, currency: match.currency };
+        if (this.resolvedCountryCache.size < RationSmartClient.RESOLVED_CACHE_MAX) {
+          this.resolvedCountryCache.set(key, resolved);
+        }
+        return resolved;
       }
     }
 
@@ -258,21 +543,8 @@ export class RationSmartClient {
   }
 
   private geoResolveCountry(countries: Country[], lat: number, lon: number): Country | null {
-    // Simple bounding-box lookup for RationSmart active countries
-    const BOXES: Record<string, { minLat: number; maxLat: number; minLon: number; maxLon: number }> = {
-      BGD: { minLat: 20.5, maxLat: 26.6, minLon: 88.0, maxLon: 92.7 },   // Bangladesh
-      ETH: { minLat: 3.0,  maxLat: 15.0, minLon: 33.0, maxLon: 48.0 },   // Ethiopia
-      IND: { minLat: 6.5,  maxLat: 35.5, minLon: 68.0, maxLon: 97.5 },   // India
-      IDN: { minLat: -11.0, maxLat: 6.1, minLon: 95.0, maxLon: 141.0 },  // Indonesia
-      MAR: { minLat: 27.6, maxLat: 35.9, minLon: -13.2, maxLon: -1.0 },  // Morocco
-      NPL: { minLat: 26.3, maxLat: 30.5, minLon: 80.0, maxLon: 88.2 },   // Nepal
-      PAK: { minLat: 23.6, maxLat: 37.1, minLon: 60.8, maxLon: 77.8 },   // Pakistan
-      PHL: { minLat: 4.6,  maxLat: 21.1, minLon: 116.9, maxLon: 126.6 }, // Philippines
-      THA: { minLat: 5.6,  maxLat: 20.5, minLon: 97.3, maxLon: 105.6 },  // Thailand
-      VNM: { minLat: 8.2,  maxLat: 23.4, minLon: 102.1, maxLon: 109.5 }, // Vietnam
-    };
     for (const country of countries) {
-      const box = BOXES[country.country_code];
+      const box = COUNTRY_BOUNDING_BOXES[country.country_code];
       if (box && lat >= box.minLat && lat <= box.maxLat && lon >= box.minLon && lon <= box.maxLon) {
         return country;
       }
@@ -305,11 +577,20 @@ export class RationSmartClient {
   // ---- Breeds ----
 
   async listBreeds(countryId: string): Promise<Breed[]> {
-    const resp = await this.request<{ success: boolean; breeds: Breed[]; count: number }>(
-      'GET',
-      `/auth/breeds/${countryId}`,
-    );
-    return resp.breeds || [];
+    const cached = this.cachedBreeds.get(countryId);
+    if (cached && Date.now() - cached.cachedAt < RationSmartClient.BREEDS_CACHE_TTL) {
+      return cached.breeds;
+    }
+
+    return this.singleFlight(`breeds:${countryId}`, async () => {
+      const resp = await this.request<{ success: boolean; breeds: Breed[]; count: number }>(
+        'GET',
+        `/auth/breeds/${countryId}`,
+      );
+      const breeds = resp.breeds || [];
+      this.cachedBreeds.set(countryId, { breeds, cachedAt: Date.now() });
+      return breeds;
+    });
   }
 
   // ---- Cow Profiles ----
@@ -323,7 +604,23 @@ export class RationSmartClient {
   }
 
   async getCow(cowId: string): Promise<CowProfile> {
-    return this.request<CowProfile>('GET', `/cow-profiles/detail/${encodeURIComponent(cowId)}`);
+    const cached = this.cachedCows.get(cowId);
+    if (cached && Date.now() - cached.cachedAt < RationSmartClient.COW_CACHE_TTL) {
+      return cached.cow;
+    }
+    return this.singleFlight(`cow:${cowId}`, async () => {
+      const cow = await this.request<CowProfile>(
+        'GET',
+        `${RationSmartClient.COW_DETAIL_PATH}${encodeURIComponent(cowId)}`,
+      );
+      // Bounded cache: evict the oldest entry at capacity
+      if (this.cachedCows.size >= RationSmartClient.COW_CACHE_MAX && !this.cachedCows.has(cowId)) {
+        const oldestKey = this.cachedCows.keys().next().value;
+        if (oldestKey) this.cachedCows.delete(oldestKey);
+      }
+      this.cachedCows.set(cowId, { cow, cachedAt: Date.now() });
+      return cow;
+    });
   }
 
   async createCow(params: CreateCowParams): Promise<CowProfile> {
@@ -347,7 +644,33 @@ export class RationSmartClient {
   // ---- Feeds ----
 
   async getFeeds(countryId: string): Promise<FeedDetails[]> {
-    return this.request<FeedDetails[]>('GET', `/master-feeds/?country_id=${encodeURIComponent(countryId)}`);
+    const cached = this.cachedFeeds.get(countryId);
+    if (cached && Date.now() - cached.cachedAt < RationSmartClient.FEEDS_CACHE_TTL) {
+      return cached.feeds;
+    }
+    return this.singleFlight(`feeds:${countryId}`, async () => {
+      const { data, etag } = await this.conditionalGet<FeedDetails[]>(
+        `/master-feeds/?country_id=${encodeURIComponent(countryId)}`,
+        cached?.etag,
+      );
+      if (data === null && cached) {
+        // 304 — stale-but-valid catalog; just refresh its timestamp
+        cached.cachedAt = Date.now();
+        return cached.feeds;
+      }
+      const feeds = data || [];
+      this.cachedFeeds.set(countryId, { feeds, cachedAt: Date.now(), etag });
+      return feeds;
+    });
+  }
+
+  /** Drop cached feed catalogs (e.g. after backend catalog updates). */
+  invalidateFeeds(countryId?: string): void {
+    if (countryId) {
+      this.cachedFeeds.delete(countryId);
+    } else {
+      this.cachedFeeds.clear();
+    }
   }
 
   // ---- Diet Generation (Multi-step orchestration) ----
@@ -357,10 +680,27 @@ export class RationSmartClient {
     countryId: string,
     deviceId: string,
   ): Promise<{ dietId: string; summary: string; totalCost: number; currency: string; feeds: { name: string; quantity_kg: number; cost: number }[] }> {
-    // Steps 1 & 2: Fetch cow profile and feed catalog in parallel — they are independent
-    const [cow, feeds] = await Promise.all([
+    // Coalesce identical concurrent generations: this is the most expensive
+    // tool (three reads plus two writes upstream), and a double-tapped client
+    // would otherwise run the optimizer twice and save two diets. In-flight
+    // only — results are never cached, so sequential calls still regenerate.
+    return this.singleFlight(
+      `generate:${deviceId}:${cowId}:${countryId}`,
+      () => this.doGenerateDiet(cowId, countryId, deviceId),
+    );
+  }
+
+  private async doGenerateDiet(
+    cowId: string,
+    countryId: string,
+    deviceId: string,
+  ): Promise<{ dietId: string; summary: string; totalCost: number; currency: string; feeds: { name: string; quantity_kg: number; cost: number }[] }> {
+    // Steps 1 & 2: Fetch cow profile, feed catalog, and country list in parallel —
+    // all three are independent (countries are only needed later for the currency)
+    const [cow, feeds, countries] = await Promise.all([
       this.getCow(cowId),
       this.getFeeds(countryId),
+      this.getCountries(),
     ]);
 
     // Verify ownership — cow must belong to the requesting device
@@ -372,8 +712,9 @@ export class RationSmartClient {
       throw new Error('No feed catalog found for this country');
     }
 
-    // Step 3: Build cattle_info from cow profile
+    // Step 3: Build cattle_info from cow profile on top of the shared defaults
     const cattleInfo: CattleInfo = {
+      ...CATTLE_INFO_DEFAULTS,
       body_weight: cow.body_weight,
       breed: cow.breed,
       lactating: cow.lactating,
@@ -383,22 +724,19 @@ export class RationSmartClient {
       days_of_pregnancy: cow.days_of_pregnancy || 0,
       tp_milk: cow.milk_protein_percent || 3.2,
       fat_milk: cow.milk_fat_percent || 3.5,
-      temperature: 25,
-      topography: 'Flat',
-      distance: 0,
-      calving_interval: 365,
-      bw_gain: 0,
-      bc_score: 3.0,
     };
 
-    // Step 4: Build feed selection (use all feeds with their baseline prices)
-    const feedSelection = feeds.map((f) => ({
-      feed_id: f.feed_id,
-      price_per_kg: f.baseline_price || 1.0,
-    }));
+    // Step 4: Build feed selection (all feeds with baseline prices) and the
+    // feed_id → name lookup for result parsing in a single pass over the catalog
+    const feedSelection: { feed_id: string; price_per_kg: number }[] = [];
+    const feedNames = new Map<string, string>();
+    for (const f of feeds) {
+      feedSelection.push({ feed_id: f.feed_id, price_per_kg: f.baseline_price || 1.0 });
+      feedNames.set(f.feed_id, f.fd_name);
+    }
 
     // Step 5: Call optimizer (longer timeout — NSGA-III can be slow)
-    const simulationId = `mcp-${randomUUID()}`;
+    const simulationId = `mcp-${randomBytes(8).toString('hex')}`;
     const optimizerResult = await this.request<Record<string, unknown>>(
       'POST',
       '/animal/diet-recommendation-working/',
@@ -408,15 +746,14 @@ export class RationSmartClient {
         cattle_info: cattleInfo,
         feed_selection: feedSelection,
       },
-      60_000, // 60s timeout for optimizer
+      this.optimizerTimeoutMs, // NSGA-III can legitimately run long
     );
 
     // Step 6: Parse optimizer response
-    const resultFeeds = this.parseDietFeeds(optimizerResult, feeds);
+    const resultFeeds = this.parseDietFeeds(optimizerResult, feedNames);
     const totalCost = resultFeeds.reduce((sum, f) => sum + f.cost, 0);
 
-    // Resolve country for currency
-    const countries = await this.getCountries();
+    // Resolve country for currency (fetched up front alongside cow/feeds)
     const country = countries.find((c) => c.id === countryId);
     const currency = country?.currency || 'USD';
 
@@ -466,9 +803,8 @@ export class RationSmartClient {
 
   private parseDietFeeds(
     result: Record<string, unknown>,
-    masterFeeds: FeedDetails[],
+    feedMap: Map<string, string>,
   ): { name: string; quantity_kg: number; cost: number }[] {
-    const feedMap = new Map(masterFeeds.map((f) => [f.feed_id, f.fd_name]));
     const parsed: { name: string; quantity_kg: number; cost: number }[] = [];
 
     // The optimizer returns results in various formats; try common patterns
@@ -519,7 +855,7 @@ export class RationSmartClient {
   private async getDietById(dietId: string): Promise<DietHistoryEntry & { telegram_user_id?: string }> {
     return this.request<DietHistoryEntry & { telegram_user_id?: string }>(
       'GET',
-      `/bot-diet-history/${encodeURIComponent(dietId)}`,
+      `${RationSmartClient.DIET_HISTORY_PATH}${encodeURIComponent(dietId)}`,
     );
   }
 
@@ -546,20 +882,23 @@ export class RationSmartClient {
   async followDiet(deviceId: string, dietId: string): Promise<string> {
     await this.verifyDietOwnership(deviceId, dietId);
 
-    // Update the diet history entry to status='following', is_active=true
+    // Create initial follow-up log entry for weekly check-in
+    const nextWeek = new Date();
+    nextWeek.setDate(nextWeek.getDate() + 7);
+
+    // Sequential on purpose: the follow-up log POST is not idempotent, so it
+    // must only run once the status update has succeeded — otherwise a failed
+    // PUT leaves a pending check-in for a diet never marked 'following', and
+    // the user's retry schedules a second one
     await this.request<Record<string, unknown>>(
       'PUT',
-      `/bot-diet-history/${encodeURIComponent(dietId)}`,
+      `${RationSmartClient.DIET_HISTORY_PATH}${encodeURIComponent(dietId)}`,
       {
         status: 'following',
         is_active: true,
       },
     );
 
-    // Create initial follow-up log entry for weekly check-in
-    const nextWeek = new Date();
-    nextWeek.setDate(nextWeek.getDate() + 7);
-
     await this.request<Record<string, unknown>>(
       'POST',
       '/bot-follow-up-logs/',
@@ -580,7 +919,7 @@ export class RationSmartClient {
     // Mark diet as archived
     await this.request<Record<string, unknown>>(
       'PUT',
-      `/bot-diet-history/${encodeURIComponent(dietId)}`,
+      `${RationSmartClient.DIET_HISTORY_PATH}${encodeURIComponent(dietId)}`,
       {
         status: 'archived',
         is_active: false,
@@ -593,10 +932,21 @@ export class RationSmartClient {
   // ---- Schedule & History ----
 
   async getDietSchedule(deviceId: string, cowId: string): Promise<string> {
-    const active = await this.request<DietHistoryEntry | null>(
-      'GET',
-      `/bot-diet-history/active/${encodeURIComponent(cowId)}?telegram_user_id=${encodeURIComponent(deviceId)}`,
-    );
+    let active: DietHistoryEntry | null;
+    try {
+      active = await this.request<DietHistoryEntry | null>(
+        'GET',
+        `/bot-diet-history/active/${encodeURIComponent(cowId)}?telegram_user_id=${encodeURIComponent(deviceId)}`,
+      );
+    } catch (error) {
+      // Typed 404 check — some backend versions answer "no active diet" with
+      // a 404 rather than an empty body; anything else propagates
+      if (error instanceof RationSmartApiError && error.status === 404) {
+        active = null;
+      } else {
+        throw error;
+      }
+    }
 
     if (!active || !active.diet_summary) {
       return 'No active diet found for this cow. Would you like to generate a new feed plan?';
@@ -611,25 +961,34 @@ export class RationSmartClient {
       return `Active diet found for ${cowName} but no feed details available.`;
     }
 
+    // Partition once: forages are split across morning/evening, concentrates fed at noon.
+    // The half-quantity line is formatted once and shared by both forage slots.
+    const forageLines: string[] = [];
+    const concentrateLines: string[] = [];
+    let totalCost = 0;
+    for (const f of feeds) {
+      const lower = f.name.toLowerCase();
+      if (FORAGE_KEYWORDS.some((k) => lower.includes(k))) {
+        forageLines.push(`  - ${f.name}: ${(f.quantity_kg / 2).toFixed(1)} kg`);
+      } else {
+        concentrateLines.push(`  - ${f.name}: ${f.quantity_kg.toFixed(1)} kg`);
+      }
+      totalCost += f.cost || 0;
+    }
+
     const lines = [
       `Daily feeding schedule for ${cowName}:`,
       '',
       'Morning (06:00):',
-      ...feeds
-        .filter((f) => f.name.toLowerCase().includes('forage') || f.name.toLowerCase().includes('grass') || f.name.toLowerCase().includes('hay') || f.name.toLowerCase().includes('straw') || f.name.toLowerCase().includes('silage'))
-        .map((f) => `  - ${f.name}: ${(f.quantity_kg / 2).toFixed(1)} kg`),
+      ...forageLines,
       '',
       'Afternoon (12:00):',
-      ...feeds
-        .filter((f) => !f.name.toLowerCase().includes('forage') && !f.name.toLowerCase().includes('grass') && !f.name.toLowerCase().includes('hay') && !f.name.toLowerCase().includes('straw') && !f.name.toLowerCase().includes('silage'))
-        .map((f) => `  - ${f.name}: ${f.quantity_kg.toFixed(1)} kg`),
+      ...concentrateLines,
       '',
       'Evening (18:00):',
-      ...feeds
-        .filter((f) => f.name.toLowerCase().includes('forage') || f.name.toLowerCase().includes('grass') || f.name.toLowerCase().includes('hay') || f.name.toLowerCase().includes('straw') || f.name.toLowerCase().includes('silage'))
-        .map((f) => `  - ${f.name}: ${(f.quantity_kg / 2).toFixed(1)} kg`),
+      ...forageLines,
       '',
-      `Total daily cost: ${currency} ${feeds.reduce((s, f) => s + (f.cost || 0), 0).toFixed(2)}`,
+      `Total daily cost: ${currency} ${totalCost.toFixed(2)}`,
     ];
 
     return lines.join('\n');
@@ -638,7 +997,8 @@ export class RationSmartClient {
   async listDietHistory(deviceId: string, cowId: string): Promise<string> {
     const resp = await this.request<{ success: boolean; count: number; diets: DietHistoryEntry[] }>(
       'GET',
-      `/bot-diet-history/cow/${encodeURIComponent(cowId)}?telegram_user_id=${encodeURIComponent(deviceId)}&include_archived=true`,
+      // Bound the payload: only the most recent entries are ever shown
+      `/bot-diet-history/cow/${encodeURIComponent(cowId)}?telegram_user_id=${encodeURIComponent(deviceId)}&include_archived=true&limit=20`,
     );
 
     const diets = resp.diets || [];
@@ -647,7 +1007,7 @@ export class RationSmartClient {
     }
 
     const lines = diets.map((d, idx) => {
-      const date = new Date(d.created_at).toLocaleDateString();
+      const date = DATE_FORMATTER.format(new Date(d.created_at));
       const status = d.is_active ? '(active)' : `(${d.status})`;
       const cost = d.total_cost_per_day ? ` - ${d.currency || ''} ${d.total_cost_per_day.toFixed(2)}/day` : '';
       return `${idx + 1}. ${d.name} ${status} - ${date}${cost}`;